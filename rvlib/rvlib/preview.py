@@ -3,7 +3,6 @@ import bpy
 import atexit
 import threading
 from http.server import BaseHTTPRequestHandler, HTTPServer
-import json
 import sys
 import argparse
 import signal
@@ -60,6 +59,8 @@ STOP_EVENT = threading.Event()
 RERUN_INDEX = 0
 CURRENT_WORK_DIR = None
 GENERATOR_WORK_DIR_PREFIX = "_rv_"
+SCENE_CLASS = None
+SCENE_CLASS_MTIME = None
 
 
 def iter_files(root_dir):
@@ -164,6 +165,18 @@ def cleanup_on_exit():
     cleanup_generator_work_dirs(ARGS.gen_base_dir, ARGS.gen_retain, CURRENT_WORK_DIR)
 
 
+def load_scene_class(script_path):
+    global SCENE_CLASS, SCENE_CLASS_MTIME
+
+    mtime = os.stat(script_path).st_mtime_ns
+    if SCENE_CLASS is None or mtime != SCENE_CLASS_MTIME:
+        import rv.internal as rvi
+
+        SCENE_CLASS = rvi._internal_load_scene_class(script_path)
+        SCENE_CLASS_MTIME = mtime
+    return SCENE_CLASS
+
+
 def run_script(
     script_path,
     preview_files=False,
@@ -175,7 +188,7 @@ def run_script(
 ):
     import rv.internal as rvi
 
-    scene_class = rvi._internal_load_scene_class(script_path)
+    scene_class = load_scene_class(script_path)
 
     reset_preview_scene_state()
     rvi._internal_begin_run(purge_orphans=True)
@@ -250,28 +263,18 @@ def preview_tick():
     return 0.1
 
 
-def run_command(path, body):
+def run_command(path):
     if path == "/rerun":
         request_rerun()
 
 
 class RequestHandler(BaseHTTPRequestHandler):
     def do_POST(self):
-        path = self.path
         content_length = int(self.headers.get("Content-Length", 0))
-        json_body = None
         if content_length > 0:
-            body = self.rfile.read(content_length).decode("utf-8")
-            try:
-                json_body = json.loads(body)
-            except json.JSONDecodeError:
-                self.send_response(400)
-                self.send_header("Content-Type", "text/plain")
-                self.send_header("Content-Length", 0)
-                self.end_headers()
-                return
-
-        run_command(path, json_body)
+            self.rfile.read(content_length)
+
+        run_command(self.path)
         self.send_response(200)
         self.send_header("Content-Type", "text/plain")
         self.send_header("Content-Length", 0)
@@ -87,7 +87,7 @@ def apply_cycles_overrides(
 
 
 def run_script(
-    script_path,
+    scene_class,
     output_dir,
     resolution,
     gpu_backend,
@@ -97,14 +97,14 @@ def run_script(
     noise_threshold_enabled,
     noise_threshold,
     seed,
+    index,
 ):
     import rv.internal as rvi
 
-    scene_class = rvi._internal_load_scene_class(script_path)
-
     def execute_run():
         rvi._internal_begin_run(purge_orphans=True)
         instance = scene_class(output_dir)
+        instance.subdir = f"{index:08d}"
         instance.resolution = resolution
         rvi._internal_set_time_limit(instance, time_limit)
         rvi._internal_run_scene_generate(instance, seed, ARGS.seed_mode)
@@ -144,13 +144,14 @@ import rv.internal as rvi  # noqa: E402
 
 RESOLUTION = rvi._internal_parse_resolution(ARGS.resolution)
 rvi._configure_generator_runtime(ARGS.generator_port, ARGS.root_dir, ARGS.work_dir)
+SCENE_CLASS = rvi._internal_load_scene_class(ARGS.script)
 
 for i in range(ARGS.number):
     seed = rvi._internal_resolve_seed(
         ARGS.seed_mode, ARGS.seed_value, ARGS.seed_base, i
     )
     run_script(
-        ARGS.script,
+        SCENE_CLASS,
         ARGS.output,
         RESOLUTION,
         ARGS.gpu_backend,
@@ -160,4 +161,5 @@ for i in range(ARGS.number):
         ARGS.noise_threshold_enabled,
         ARGS.noise_threshold,
         seed,
+        ARGS.seed_base + i,
     )
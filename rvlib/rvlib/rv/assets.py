@@ -44,6 +44,19 @@ def _load_all_objects(path: str):
     return data_to.objects
 
 
+def _load_named_objects(path: str, names: list[str]) -> tuple[dict, list[str]]:
+    wanted = set(names)
+    with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+        available = list(data_from.objects)
+        requested = [name for name in available if name in wanted]
+        data_to.objects = requested
+
+    loaded = {
+        name: obj for name, obj in zip(requested, data_to.objects) if obj is not None
+    }
+    return loaded, available
+
+
 def _read_json_property(id_data, key: str):
     raw = id_data.get(key)
     if raw is None or not isinstance(raw, str):
@@ -91,7 +104,7 @@ def _combine_arglist_set(args):
     result = set()
     for p in args:
         if isinstance(p, (list, tuple, set, frozenset)):
-            result = result.union(set(p))
+            result.update(p)
         else:
             result.add(p)
     return result
@@ -285,10 +285,11 @@ def _get_object_world_vertices(obj: bpy.types.Object) -> list[Vector]:
         obj_eval.to_mesh_clear()
 
 
-def _get_object_world_location(obj: bpy.types.Object) -> Vector:
+def _get_object_world_location(obj: bpy.types.Object, depsgraph=None) -> Vector:
     if obj is None:
         return Vector((0.0, 0.0, 0.0))
-    depsgraph = bpy.context.evaluated_depsgraph_get()
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
     obj_eval = obj.evaluated_get(depsgraph)
     return obj_eval.matrix_world.translation.copy()
 
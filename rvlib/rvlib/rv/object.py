@@ -501,10 +501,9 @@ class Object(_Serializable):
         """
         Orients the current object to point at another object, with an optional rotation around the direction vector.
         """
-        bpy.context.view_layer.update()
-        direction = _get_object_world_location(rv_obj.obj) - _get_object_world_location(
-            self.obj
-        )
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        target = _get_object_world_location(rv_obj.obj, depsgraph)
+        direction = target - _get_object_world_location(self.obj, depsgraph)
         rot_quat = direction.to_track_quat("-Z", "Y")
         if angle != 0.0:
             axis = direction.normalized()
@@ -530,6 +529,13 @@ class Object(_Serializable):
         self.obj.select_set(True)
         bpy.context.view_layer.objects.active = self.obj
 
+    def _has_smooth_by_angle_modifier(self) -> bool:
+        for modifier in self.obj.modifiers:
+            node_group = getattr(modifier, "node_group", None)
+            if node_group is not None and node_group.name.startswith("Smooth by Angle"):
+                return True
+        return False
+
     def set_shading(
         self,
         shading: Literal["flat", "smooth", "auto"],
@@ -537,6 +543,17 @@ class Object(_Serializable):
         """
         Set shading to flat, smooth, or auto.
         """
+        mesh = self.obj.data
+        if (
+            shading in ("flat", "smooth")
+            and isinstance(mesh, bpy.types.Mesh)
+            and not self._has_smooth_by_angle_modifier()
+        ):
+            polygons = mesh.polygons
+            polygons.foreach_set("use_smooth", [shading == "smooth"] * len(polygons))
+            mesh.update()
+            return self
+
         self._select_for_shading_ops()
 
         if shading == "flat":
@@ -752,6 +769,7 @@ class Object(_Serializable):
 
     def _get_meta(self) -> dict:
         res = super()._get_meta()
+        rotation = self.obj.rotation_quaternion
         res.update(
             {
                 "index": self.index,
@@ -765,7 +783,8 @@ class Object(_Serializable):
                     if slot.material is not None
                 ],
                 "location": tuple(self.obj.location),
-                "rotation": tuple(self.obj.rotation_euler),
+                "rotation": tuple(rotation.to_euler()),
+                "rotation_quaternion": tuple(rotation),
                 "scale": tuple(self.obj.scale),
             }
         )
@@ -1,4 +1,5 @@
 from enum import Enum
+from types import MappingProxyType
 
 
 class RenderPass(Enum):
@@ -35,30 +36,32 @@ class RenderPass(Enum):
     CRYPTO_ASSET = "CryptoAsset"
 
 
-PASS_MAP = {
-    RenderPass.Z: "use_pass_z",
-    RenderPass.VECTOR: "use_pass_vector",
-    RenderPass.MIST: "use_pass_mist",
-    RenderPass.POSITION: "use_pass_position",
-    RenderPass.NORMAL: "use_pass_normal",
-    RenderPass.UV: "use_pass_uv",
-    RenderPass.OBJECT_INDEX: "use_pass_object_index",
-    RenderPass.MATERIAL_INDEX: "use_pass_material_index",
-    RenderPass.SHADOW: "use_pass_shadow",
-    RenderPass.AO: "use_pass_ambient_occlusion",
-    RenderPass.EMISSION: "use_pass_emit",
-    RenderPass.ENVIRONMENT: "use_pass_environment",
-    RenderPass.SHADOW_CATCHER: "use_pass_shadow_catcher",
-    RenderPass.DIFFUSE_COLOR: "use_pass_diffuse_color",
-    RenderPass.DIFFUSE_DIRECT: "use_pass_diffuse_direct",
-    RenderPass.DIFFUSE_INDIRECT: "use_pass_diffuse_indirect",
-    RenderPass.GLOSSY_COLOR: "use_pass_glossy_color",
-    RenderPass.GLOSSY_DIRECT: "use_pass_glossy_direct",
-    RenderPass.GLOSSY_INDIRECT: "use_pass_glossy_indirect",
-    RenderPass.TRANSMISSION_COLOR: "use_pass_transmission_color",
-    RenderPass.TRANSMISSION_DIRECT: "use_pass_transmission_direct",
-    RenderPass.TRANSMISSION_INDIRECT: "use_pass_transmission_indirect",
-    RenderPass.CRYPTO_OBJECT: "use_pass_cryptomatte_object",
-    RenderPass.CRYPTO_MATERIAL: "use_pass_cryptomatte_material",
-    RenderPass.CRYPTO_ASSET: "use_pass_cryptomatte_asset",
-}
+PASS_MAP = MappingProxyType(
+    {
+        RenderPass.Z: "use_pass_z",
+        RenderPass.VECTOR: "use_pass_vector",
+        RenderPass.MIST: "use_pass_mist",
+        RenderPass.POSITION: "use_pass_position",
+        RenderPass.NORMAL: "use_pass_normal",
+        RenderPass.UV: "use_pass_uv",
+        RenderPass.OBJECT_INDEX: "use_pass_object_index",
+        RenderPass.MATERIAL_INDEX: "use_pass_material_index",
+        RenderPass.SHADOW: "use_pass_shadow",
+        RenderPass.AO: "use_pass_ambient_occlusion",
+        RenderPass.EMISSION: "use_pass_emit",
+        RenderPass.ENVIRONMENT: "use_pass_environment",
+        RenderPass.SHADOW_CATCHER: "use_pass_shadow_catcher",
+        RenderPass.DIFFUSE_COLOR: "use_pass_diffuse_color",
+        RenderPass.DIFFUSE_DIRECT: "use_pass_diffuse_direct",
+        RenderPass.DIFFUSE_INDIRECT: "use_pass_diffuse_indirect",
+        RenderPass.GLOSSY_COLOR: "use_pass_glossy_color",
+        RenderPass.GLOSSY_DIRECT: "use_pass_glossy_direct",
+        RenderPass.GLOSSY_INDIRECT: "use_pass_glossy_indirect",
+        RenderPass.TRANSMISSION_COLOR: "use_pass_transmission_color",
+        RenderPass.TRANSMISSION_DIRECT: "use_pass_transmission_direct",
+        RenderPass.TRANSMISSION_INDIRECT: "use_pass_transmission_indirect",
+        RenderPass.CRYPTO_OBJECT: "use_pass_cryptomatte_object",
+        RenderPass.CRYPTO_MATERIAL: "use_pass_cryptomatte_material",
+        RenderPass.CRYPTO_ASSET: "use_pass_cryptomatte_asset",
+    }
+)
@@ -1,20 +1,31 @@
+import math
+
 import bpy
 from typing import Union
 
 from .compositor import _configure_semantic_aovs
 from .passes import PASS_MAP
 from .types import RenderPassSet, Resolution, SemanticChannelSet
-from .utils import _require_blender_attr
+
+_SUPPORTED_PASS_ATTRS = None
 
 
 def _use_cycles() -> None:
-    if bpy.context.scene.render.engine != "CYCLES":
-        bpy.context.scene.render.engine = "CYCLES"
+    render = bpy.context.scene.render
+    if render.engine != "CYCLES":
+        render.engine = "CYCLES"
 
 
 def _use_gpu():
-    if bpy.context.scene.cycles.device != "GPU":
-        bpy.context.scene.cycles.device = "GPU"
+    cycles = bpy.context.scene.cycles
+    if cycles.device != "GPU":
+        cycles.device = "GPU"
+
+
+def _use_persistent_data():
+    render = bpy.context.scene.render
+    if not render.use_persistent_data:
+        render.use_persistent_data = True
 
 
 def _deselect():
@@ -22,14 +33,29 @@ def _deselect():
 
 
 def _set_resolution(resolution: Resolution):
-    scene = bpy.context.scene
-    scene.render.resolution_x = resolution[0]
-    scene.render.resolution_y = resolution[1]
-    scene.render.resolution_percentage = 100
+    render = bpy.context.scene.render
+    if render.resolution_x != resolution[0]:
+        render.resolution_x = resolution[0]
+    if render.resolution_y != resolution[1]:
+        render.resolution_y = resolution[1]
+    if render.resolution_percentage != 100:
+        render.resolution_percentage = 100
 
 
 def _set_time_limit(time_limit: float):
-    bpy.context.scene.cycles.time_limit = time_limit
+    cycles = bpy.context.scene.cycles
+    if not math.isclose(cycles.time_limit, time_limit, rel_tol=1e-6):
+        cycles.time_limit = time_limit
+
+
+def _supported_pass_attrs(layer) -> frozenset:
+    global _SUPPORTED_PASS_ATTRS
+    if _SUPPORTED_PASS_ATTRS is None:
+        properties = layer.bl_rna.properties
+        _SUPPORTED_PASS_ATTRS = frozenset(
+            attr for attr in PASS_MAP.values() if attr in properties
+        )
+    return _SUPPORTED_PASS_ATTRS
 
 
 def _configure_passes(
@@ -39,19 +65,23 @@ def _configure_passes(
     Enable/disable Cycles render-passes according to the `passes` list.
     """
     layer = bpy.context.view_layer
+    supported = _supported_pass_attrs(layer)
 
-    for attr in PASS_MAP.values():
-        if hasattr(layer, attr):
-            setattr(layer, attr, False)
-
+    wanted = {"use_pass_object_index"}
     for p in passes:
-        pass_attr = PASS_MAP.get(p)
-        if not pass_attr:
-            raise RuntimeError(f"Unknown render pass '{p.name}'.")
-        _require_blender_attr(layer, pass_attr, f"render pass {p.name}")
-        setattr(layer, pass_attr, True)
-
-    _require_blender_attr(layer, "use_pass_object_index", "render pass OBJECT_INDEX")
-    layer.use_pass_object_index = True
+        try:
+            pass_attr = PASS_MAP[p]
+        except KeyError as exc:
+            raise RuntimeError(f"Unknown render pass '{p.name}'.") from exc
+        if pass_attr not in supported:
+            raise RuntimeError(f"Blender does not support render pass {p.name}.")
+        wanted.add(pass_attr)
+    if "use_pass_object_index" not in supported:
+        raise RuntimeError("Blender does not support render pass OBJECT_INDEX.")
+
+    for attr in supported:
+        enabled = attr in wanted
+        if getattr(layer, attr) != enabled:
+            setattr(layer, attr, enabled)
 
     _configure_semantic_aovs(layer, semantic_channels or set())
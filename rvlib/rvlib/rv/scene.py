@@ -8,6 +8,7 @@ import uuid
 from mathutils import Vector
 from typing import TYPE_CHECKING, Literal, Optional, Union
 
+import bmesh
 import bpy
 import mathutils
 
@@ -15,6 +16,7 @@ from .assets import (
     _combine_arglist_set,
     _estimate_loader_radius,
     _load_all_objects,
+    _load_named_objects,
     _load_single_object,
     _remove_blender_object,
 )
@@ -42,6 +44,7 @@ from .render import (
     _set_time_limit,
     _use_cycles,
     _use_gpu,
+    _use_persistent_data,
 )
 from .scatter import (
     _finalize_scatter_stats,
@@ -54,7 +57,6 @@ from .types import CellCoords, Float2, RenderPassSet, Resolution, ScatterSource,
 from .utils import (
     _get_generated_collection,
     _mark_object_tree,
-    _move_object_to_generated_collection,
 )
 
 if TYPE_CHECKING:
@@ -63,6 +65,21 @@ if TYPE_CHECKING:
     from .world import World
 
 
+def _new_primitive_object(name: str, build_mesh) -> bpy.types.Object:
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    try:
+        bm.loops.layers.uv.new("UVMap")
+        build_mesh(bm)
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+    obj = bpy.data.objects.new(name, mesh)
+    _mark_object_tree(obj)
+    _get_generated_collection().objects.link(obj)
+    return obj
+
+
 class ObjectFactory:
     def __init__(self, scene: "Scene") -> None:
         self.scene = scene
@@ -80,29 +97,31 @@ class ObjectFactory:
         segments: int = 32,
         ring_count: int = 16,
     ) -> "Object":
-        bpy.ops.mesh.primitive_uv_sphere_add(
-            radius=radius, segments=segments, ring_count=ring_count
+        sphere = _new_primitive_object(
+            name,
+            lambda bm: bmesh.ops.create_uvsphere(
+                bm,
+                u_segments=segments,
+                v_segments=ring_count,
+                radius=radius,
+                calc_uvs=True,
+            ),
         )
-        sphere = bpy.context.active_object
-        _move_object_to_generated_collection(sphere)
-        _mark_object_tree(sphere)
-        sphere.name = name
         return Object(sphere, self.scene)
 
     def cube(self, name: str = "Cube", size: float = 2.0) -> "Object":
-        bpy.ops.mesh.primitive_cube_add(size=size)
-        cube = bpy.context.active_object
-        _move_object_to_generated_collection(cube)
-        _mark_object_tree(cube)
-        cube.name = name
+        cube = _new_primitive_object(
+            name, lambda bm: bmesh.ops.create_cube(bm, size=size, calc_uvs=True)
+        )
         return Object(cube, self.scene)
 
     def plane(self, name: str = "Plane", size: float = 2.0) -> "Object":
-        bpy.ops.mesh.primitive_plane_add(size=size)
-        plane = bpy.context.active_object
-        _move_object_to_generated_collection(plane)
-        _mark_object_tree(plane)
-        plane.name = name
+        plane = _new_primitive_object(
+            name,
+            lambda bm: bmesh.ops.create_grid(
+                bm, x_segments=1, y_segments=1, size=size / 2.0, calc_uvs=True
+            ),
+        )
         return Object(plane, self.scene)
 
 
@@ -173,42 +192,38 @@ class AssetFactory:
             obj = _load_single_object(path)
             _mark_object_tree(obj)
             return ObjectLoader(obj, self.scene)
-        objects = _load_all_objects(path)
-        for obj in objects:
-            _mark_object_tree(obj)
-            if obj.name == import_name:
-                return ObjectLoader(obj, self.scene)
-        object_names = ", ".join(obj.name for obj in objects)
-        raise ValueError(
-            f"Object '{import_name}' was not found in '{path}'. "
-            f"Available objects: [{object_names}]"
-        )
+        loaded, available = _load_named_objects(path, [import_name])
+        obj = loaded.get(import_name)
+        if obj is None:
+            object_names = ", ".join(available)
+            raise ValueError(
+                f"Object '{import_name}' was not found in '{path}'. "
+                f"Available objects: [{object_names}]"
+            )
+        _mark_object_tree(obj)
+        return ObjectLoader(obj, self.scene)
 
     def objects(
         self, blendfile: str, import_names: Union[list[str], None] = None
     ) -> list["ObjectLoader"]:
         path = str(pathlib.Path(blendfile).expanduser())
-        objects = _load_all_objects(path)
         res = []
         if import_names is None:
-            for obj in objects:
+            for obj in _load_all_objects(path):
                 _mark_object_tree(obj)
                 res.append(ObjectLoader(obj, self.scene))
         else:
-            import_names_set = set(import_names)
-            found_import_names = set()
-            for obj in objects:
+            loaded, available = _load_named_objects(path, import_names)
+            for obj in loaded.values():
                 _mark_object_tree(obj)
-                if obj.name in import_names_set:
-                    found_import_names.add(obj.name)
-                    res.append(ObjectLoader(obj, self.scene))
-            missing = import_names_set - found_import_names
+                res.append(ObjectLoader(obj, self.scene))
+            missing = set(import_names) - loaded.keys()
             if missing:
                 missing_sorted = ", ".join(sorted(missing))
-                available = ", ".join(obj.name for obj in objects)
+                available_names = ", ".join(available)
                 raise ValueError(
                     f"Objects [{missing_sorted}] were not found in '{path}'. "
-                    f"Available objects: [{available}]"
+                    f"Available objects: [{available_names}]"
                 )
         return res
 
@@ -348,9 +363,9 @@ class Scene(ABC, _Serializable):
     lights: LightFactory
     assets: AssetFactory
     generators: GeneratorFactory
-    _objects: set["Object"]
-    _materials: set["Material"]
-    _lights: set["Light"]
+    _objects: list["Object"]
+    _materials: list["Material"]
+    _lights: list["Light"]
     semantic_channels: SemanticChannelSet
     semantic_mask_threshold: float = 0.5
     seed: Union[int, None] = None
@@ -368,9 +383,9 @@ class Scene(ABC, _Serializable):
         self.passes = set()
         self.output_dir = output_dir
         self.subdir = None
-        self._objects = set()
-        self._materials = set()
-        self._lights = set()
+        self._objects = []
+        self._materials = []
+        self._lights = []
         self.tags = set()
         self.semantic_channels = set()
         self.semantic_mask_threshold = 0.5
@@ -386,10 +401,11 @@ class Scene(ABC, _Serializable):
         self.generators = GeneratorFactory(self)
 
         _get_generated_collection()
-        bpy.ops.object.camera_add()
-        _move_object_to_generated_collection(bpy.context.active_object)
-        _mark_object_tree(bpy.context.active_object)
-        self.camera = Camera(bpy.context.active_object, self)
+        camera_data = bpy.data.cameras.new("Camera")
+        camera_obj = bpy.data.objects.new("Camera", camera_data)
+        _mark_object_tree(camera_obj)
+        _get_generated_collection().objects.link(camera_obj)
+        self.camera = Camera(camera_obj, self)
         bpy.context.scene.camera = self.camera.obj
         self.camera.set_location(mathutils.Vector((0, 0, 10)))
         self._set_user_view()
@@ -573,6 +589,7 @@ class Scene(ABC, _Serializable):
         if self.output_dir is None:
             _configure_compositor(None, semantic_channels=self.semantic_channels, semantic_mask_threshold=self.semantic_mask_threshold)
         else:
+            _use_persistent_data()
             if self.subdir is None:
                 self.subdir = str(uuid.uuid4())
             _configure_compositor(os.path.join(self.output_dir, self.subdir), semantic_channels=self.semantic_channels, semantic_mask_threshold=self.semantic_mask_threshold)
@@ -583,17 +600,17 @@ class Scene(ABC, _Serializable):
 
     def _register_object(self, obj: "Object") -> int:
         self.object_index_counter += 1
-        self._objects.add(obj)
+        self._objects.append(obj)
         return self.object_index_counter
 
     def _register_material(self, material: "Material") -> int:
         self.material_index_counter += 1
-        self._materials.add(material)
+        self._materials.append(material)
         return self.material_index_counter
 
     def _register_light(self, light: "Light") -> int:
         self.light_index_counter += 1
-        self._lights.add(light)
+        self._lights.append(light)
         return self.light_index_counter
 
     def _get_meta(self) -> dict:
@@ -604,7 +621,7 @@ class Scene(ABC, _Serializable):
                 "time_limit": self.time_limit,
                 "seed": self.seed,
                 "seed_mode": self.seed_mode,
-                "passes": [p.value for p in self.passes],
+                "passes": sorted(p.value for p in self.passes),
                 "tags": list(self.tags),
                 "semantic_channels": sorted(self.semantic_channels),
                 "semantic_mask_threshold": self.semantic_mask_threshold,
@@ -618,5 +635,6 @@ class Scene(ABC, _Serializable):
     def _internal_save_metadata(self, filename: str) -> None:
         if self.output_dir is None or self.subdir is None:
             raise RuntimeError("Cannot save metadata without an output directory.")
+        payload = json.dumps(self._get_meta(), indent=4)
         with open(os.path.join(self.output_dir, self.subdir, filename), "w") as fout:
-            json.dump(self._get_meta(), fout, indent=4)
+            fout.write(payload)
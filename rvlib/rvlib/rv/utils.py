@@ -111,18 +111,30 @@ def _mark_world_tree(world) -> None:
         _mark_node_tree(node_tree)
 
 
-def _remove_owned_unused(id_collection) -> None:
-    for datablock in list(id_collection):
-        if not _is_owned(datablock):
-            continue
-        if getattr(datablock, "users", 0) > 0:
-            continue
+def _remove_ids(ids: list, id_collection) -> None:
+    if not ids:
+        return
+    if hasattr(bpy.data, "batch_remove"):
+        bpy.data.batch_remove(ids=ids)
+        return
+    for datablock in ids:
         try:
             id_collection.remove(datablock, do_unlink=True)
         except TypeError:
             id_collection.remove(datablock)
 
 
+def _remove_owned_unused(id_collection) -> None:
+    _remove_ids(
+        [
+            datablock
+            for datablock in id_collection
+            if _is_owned(datablock) and getattr(datablock, "users", 0) == 0
+        ],
+        id_collection,
+    )
+
+
 def _get_generated_collection() -> bpy.types.Collection:
     if "Generated" not in bpy.data.collections:
         bpy.data.collections.new("Generated")
@@ -132,14 +144,6 @@ def _get_generated_collection() -> bpy.types.Collection:
     return collection
 
 
-def _move_object_to_generated_collection(obj: bpy.types.Object) -> None:
-    generated = _get_generated_collection()
-    for col in list(obj.users_collection):
-        col.objects.unlink(obj)
-    if generated.objects.get(obj.name) is None:
-        generated.objects.link(obj)
-
-
 def _remove_rv_data() -> None:
     _get_generated_collection()
     scene = bpy.context.scene
@@ -149,17 +153,12 @@ def _remove_rv_data() -> None:
     ):
         scene.compositing_node_group = None
 
-    for obj in list(bpy.data.objects):
-        if not _is_owned(obj):
-            continue
-        bpy.data.objects.remove(obj, do_unlink=True)
+    _remove_ids([obj for obj in bpy.data.objects if _is_owned(obj)], bpy.data.objects)
 
-    for world in list(bpy.data.worlds):
-        if not _is_owned(world):
-            continue
-        if scene.world == world:
-            scene.world = None
-        bpy.data.worlds.remove(world, do_unlink=True)
+    owned_worlds = [world for world in bpy.data.worlds if _is_owned(world)]
+    if scene.world in owned_worlds:
+        scene.world = None
+    _remove_ids(owned_worlds, bpy.data.worlds)
 
     _remove_owned_unused(bpy.data.images)
     _remove_owned_unused(bpy.data.materials)
@@ -218,15 +217,20 @@ def _internal_load_scene_class(script_path: str):
 
     import rv
 
-    scene_classes = []
-    for _, obj in inspect.getmembers(module, inspect.isclass):
-        if issubclass(obj, rv.Scene) and obj is not rv.Scene:
-            scene_classes.append(obj)
+    scene_class = None
+    for obj in vars(module).values():
+        if not isinstance(obj, type) or obj is rv.Scene or obj is scene_class:
+            continue
+        if not issubclass(obj, rv.Scene):
+            continue
+        if scene_class is not None:
+            raise RuntimeError(_INTERNAL_CLASS_COUNT_ERROR_MESSAGE.strip())
+        scene_class = obj
 
-    if len(scene_classes) != 1:
+    if scene_class is None:
         raise RuntimeError(_INTERNAL_CLASS_COUNT_ERROR_MESSAGE.strip())
 
-    return scene_classes[0]
+    return scene_class
 
 
 def _internal_run_scene_generate(
@@ -329,6 +333,17 @@ def _enable_cycles_backend(preferences, selected_type: str) -> None:
         )
 
 
+def _configure_compositor_device(scene, device: str) -> None:
+    render = scene.render
+    if hasattr(render, "compositor_device") and render.compositor_device != device:
+        render.compositor_device = device
+    if (
+        hasattr(render, "compositor_precision")
+        and render.compositor_precision != "FULL"
+    ):
+        render.compositor_precision = "FULL"
+
+
 def _internal_configure_cycles_backend(requested_backend: str) -> str:
     scene = bpy.context.scene
     scene.cycles.device = "GPU"
@@ -349,6 +364,7 @@ def _internal_configure_cycles_backend(requested_backend: str) -> str:
 
     if requested == "cpu":
         scene.cycles.device = "CPU"
+        _configure_compositor_device(scene, "CPU")
         return "CPU"
 
     selected_type = requested.upper()
@@ -361,6 +377,7 @@ def _internal_configure_cycles_backend(requested_backend: str) -> str:
 
     _enable_cycles_backend(preferences, selected_type)
     scene.cycles.device = "GPU"
+    _configure_compositor_device(scene, "GPU")
     return selected_type
 
 
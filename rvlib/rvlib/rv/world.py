@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 import math
+import os
 from typing import Self, Union
 
 import bpy
@@ -7,6 +8,25 @@ import bpy
 from .types import ColorRGBA
 from .utils import _mark_owned, _mark_world_tree
 
+_HDRI_CACHE: dict[str, bpy.types.Image] = {}
+
+
+def _load_hdri_image(path: str) -> bpy.types.Image:
+    abs_path = os.path.abspath(bpy.path.abspath(path))
+    image = _HDRI_CACHE.get(abs_path)
+    if image is not None:
+        try:
+            if bpy.data.images.get(image.name) == image:
+                return image
+        except ReferenceError:
+            pass
+
+    image = bpy.data.images.load(abs_path, check_existing=False)
+    image.use_fake_user = True
+    _mark_owned(image)
+    _HDRI_CACHE[abs_path] = image
+    return image
+
 
 class World(ABC):
     """
@@ -195,10 +215,7 @@ class HDRIWorld(World):
         links.new(node_background.outputs["Background"], node_output.inputs["Surface"])
 
         if self.hdri_path is not None:
-            node_env_tex.image = bpy.data.images.load(
-                self.hdri_path, check_existing=False
-            )
-            _mark_owned(node_env_tex.image)
+            node_env_tex.image = _load_hdri_image(self.hdri_path)
 
         if self.strength is not None:
             node_background.inputs["Strength"].default_value = self.strength
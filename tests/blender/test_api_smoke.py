@@ -141,6 +141,15 @@ class ApiSmokeTest(unittest.TestCase):
         )
         cube = self.scene.objects.cube("Cube", size=1.0).set_location((0.0, 0.0, 1.0))
         plane = self.scene.objects.plane("Plane", size=8.0).set_location((0.0, 0.0, 0.0))
+        for primitive, dimensions, polygon_count in (
+            (sphere, (1.0, 1.0, 1.0), 32 * 16),
+            (cube, (1.0, 1.0, 1.0), 6),
+            (plane, (8.0, 8.0, 0.0), 1),
+        ):
+            for actual, expected in zip(primitive.get_dimensions("local"), dimensions):
+                self.assertAlmostEqual(actual, expected, places=4)
+            self.assertEqual(len(primitive.obj.data.polygons), polygon_count)
+            self.assertIn("UVMap", primitive.obj.data.uv_layers)
 
         basic_world = rv.BasicWorld()
         self.assertIs(
@@ -204,6 +213,15 @@ class ApiSmokeTest(unittest.TestCase):
         modifier_name = _add_geometry_nodes_modifier(cube)
         cube.set_location((0.0, 0.0, 1.0))
         cube.set_rotation(mathutils.Euler((0.1, 0.2, 0.3)))
+        cube_meta = cube._get_meta()
+        for actual, expected in zip(cube_meta["rotation"], (0.1, 0.2, 0.3)):
+            self.assertAlmostEqual(actual, expected, places=5)
+        self.assertEqual(len(cube_meta["rotation_quaternion"]), 4)
+        for actual, expected in zip(
+            cube_meta["rotation_quaternion"],
+            mathutils.Euler((0.1, 0.2, 0.3)).to_quaternion(),
+        ):
+            self.assertAlmostEqual(actual, expected, places=5)
         cube.set_scale(1.1)
         cube.set_property("custom", 7)
         cube.set_modifier_input("ScaleInput", 1.25, modifier_name=modifier_name)
@@ -216,6 +234,19 @@ class ApiSmokeTest(unittest.TestCase):
         cube.point_at(empty, angle=15.0)
         cube.rotate_around_axis(mathutils.Vector((0.0, 0.0, 1.0)), 20.0)
         cube.set_shading("smooth")
+        self.assertTrue(all(poly.use_smooth for poly in cube.obj.data.polygons))
+        cube.set_shading("auto")
+        cube.set_shading("flat")
+        self.assertFalse(any(poly.use_smooth for poly in cube.obj.data.polygons))
+        self.assertFalse(
+            any(
+                modifier.node_group is not None
+                and modifier.node_group.name.startswith("Smooth by Angle")
+                for modifier in cube.obj.modifiers
+                if modifier.type == "NODES"
+            )
+        )
+        cube.set_shading("smooth")
         cube.show_debug_axes(True)
         cube.show_debug_name(True)
         self.assertEqual(len(cube.get_dimensions("world")), 3)
@@ -353,6 +384,34 @@ class ApiSmokeTest(unittest.TestCase):
 
         rvi._internal_end_run()
 
+    def test_assets_named_loading(self):
+        with self.assertRaises(ValueError) as ctx:
+            self.scene.assets.object(str(ROCK_BLEND), import_name="Missing")
+        self.assertIn("Missing", str(ctx.exception))
+        self.assertIn("Rock", str(ctx.exception))
+
+        with self.assertRaises(ValueError) as ctx:
+            self.scene.assets.objects(
+                str(EXPORTED_BLEND), import_names=["Cube_0", "Missing"]
+            )
+        self.assertIn("[Missing]", str(ctx.exception))
+        self.assertIn("Cube_0", str(ctx.exception))
+
+        placeholder = self.scene.objects.empty("Rock")
+        first = self.scene.assets.object(str(ROCK_BLEND), import_name="Rock")
+        second = self.scene.assets.object(str(ROCK_BLEND), import_name="Rock")
+        self.assertEqual(placeholder.obj.name, "Rock")
+        self.assertEqual(first.obj.type, "MESH")
+        self.assertEqual(second.obj.type, "MESH")
+        self.assertNotEqual(first.obj.name, "Rock")
+        self.assertNotEqual(second.obj.name, "Rock")
+
+        loaders = self.scene.assets.objects(str(EXPORTED_BLEND), import_names=["Cube_0"])
+        reloaded = self.scene.assets.objects(str(EXPORTED_BLEND), import_names=["Cube_0"])
+        self.assertEqual(len(loaders), 1)
+        self.assertEqual(len(reloaded), 1)
+        self.assertIsNot(loaders[0].obj, reloaded[0].obj)
+
 
 if __name__ == "__main__":
     unittest.main()